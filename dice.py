@@ -15,10 +15,18 @@ Types of dice:
 from random import randint
 
 def make_fair_dice(sides):
-    """Return a die that returns 1 to SIDES with equal chance."""
+    """Return a die that returns 1 to SIDES with equal chance.
+
+    The die records its number of sides in its SIDES attribute, so that callers
+    can sample many outcomes at once instead of calling it repeatedly.
+
+    >>> make_fair_dice(4).sides
+    4
+    """
     assert type(sides) == int and sides >= 1, 'Illegal value for sides'
     def dice():
         return randint(1,sides)
+    dice.sides = sides
     return dice
 
 four_sided = make_fair_dice(4)
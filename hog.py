@@ -2,12 +2,22 @@
 
 from dice import four_sided, six_sided, make_test_dice
 from ucb import main, trace, log_current_line, interact
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from multiprocessing import Pool
+from operator import mul
+from random import choices, random, seed
+import pickle
 import sys
-from typing import Callable, Union
 
 MAX_RECURSION_DEPTH = 10000
 MAX_DICE_ROLLS = 10
 GOAL_SCORE = 100 # The goal of Hog is to score 100 points.
+# Free bacon points for rolling 0 dice against each possible opponent score
+FREE_BACON = tuple(max(score % 10, score // 10) + 1 for score in range(GOAL_SCORE))
+
+# best_num_dice_to_roll recurses deeper than Python's default limit allows
+sys.setrecursionlimit(max(sys.getrecursionlimit(), MAX_RECURSION_DEPTH))
 
 ######################
 # Phase 1: Simulator #
@@ -17,7 +27,8 @@ GOAL_SCORE = 100 # The goal of Hog is to score 100 points.
 
 def roll_dice(num_rolls, dice=six_sided):
     """Roll DICE for NUM_ROLLS times.  Return either the sum of the outcomes,
-    or 1 if a 1 is rolled (Pig out). This calls DICE exactly NUM_ROLLS times.
+    or 1 if a 1 is rolled (Pig out). This calls DICE exactly NUM_ROLLS times,
+    except for fair dice, whose outcomes are all drawn at once instead.
 
     num_rolls:  The number of dice rolls that will be made; at least 1.
     dice:       A zero-argument function that returns an integer outcome.
@@ -26,8 +37,14 @@ def roll_dice(num_rolls, dice=six_sided):
     assert type(num_rolls) == int, 'num_rolls must be an integer.'
     assert num_rolls > 0, 'Must roll at least once.'
 
+    # Fair dice know their number of sides, so draw all of their outcomes in one call
+    sides = getattr(dice, 'sides', None)
+    if sides:
+        rolls = choices(range(1, sides + 1), k=num_rolls)
+        return 1 if 1 in rolls else sum(rolls)
+
     rolled_one = False
-    sum = 0
+    total = 0
     i = 0
     # rolls the dice num_rolls times, storing the sum in roll_res
     # if a 1 is rolled, flip rolled_one to True
@@ -35,11 +52,11 @@ def roll_dice(num_rolls, dice=six_sided):
         roll_res = dice()
         if roll_res == 1:
             rolled_one = True
-        sum += roll_res
+        total += roll_res
         i += 1
 
     # return sum of dice rolls if 1 isn't rolled, returns 1 otherwise
-    return 1 if rolled_one else sum
+    return 1 if rolled_one else total
 
 def take_turn(num_rolls, opponent_score, dice=six_sided):
     """Simulate a turn rolling NUM_ROLLS dice, which may be 0 (Free bacon).
@@ -54,7 +71,7 @@ def take_turn(num_rolls, opponent_score, dice=six_sided):
     assert opponent_score < 100, 'The game should be over.'
     # Free Bacon if choose to roll 0
     if num_rolls == 0:
-        return max(opponent_score % 10, opponent_score // 10) + 1
+        return FREE_BACON[opponent_score]
     else:
     # Result of rolling dice num_rolls times
         return roll_dice(num_rolls, dice)
@@ -102,8 +119,8 @@ def play(strategy0, strategy1, goal=GOAL_SCORE):
     score, opponent_score = 0, 0
     # the game plays until a player reaches 100 points
     while score < goal and opponent_score < goal:
-        # hog wild rule
-        dice = select_dice(score, opponent_score)
+        # hog wild rule, as in select_dice
+        dice = four_sided if (score + opponent_score) % 7 == 0 else six_sided
         # take turn with player 0 if current turn belongs to player 0
         # otherwise take turn with player 1 if current turn belongs to player 1
         if who == 0:
@@ -114,7 +131,7 @@ def play(strategy0, strategy1, goal=GOAL_SCORE):
         if score * 2 == opponent_score or opponent_score * 2 == score:
             score, opponent_score = opponent_score, score
         # switch to other player after current player's turn ends
-        who = other(who)
+        who = 1 - who
 
     return score, opponent_score
 
@@ -140,9 +157,14 @@ def always_roll(n):
     >>> strategy(99, 99)
     5
     """
-    def strategy(score, opponent_score):
-        return n
-    return strategy
+    # A partial of a top-level function, unlike a nested function, can be
+    # pickled and sent to the worker processes of average_win_rate
+    return partial(roll_n, n)
+
+def roll_n(n, score, opponent_score):
+    """The strategy returned by always_roll(N), which rolls N dice regardless
+    of SCORE and OPPONENT_SCORE."""
+    return n
 
 # Experiments
 
@@ -215,34 +237,133 @@ def winner(strategy0, strategy1):
     else:
         return 1
 
-def average_win_rate(strategy, baseline=always_roll(BASELINE_NUM_ROLLS)):
-    """Return the average win rate (0 to 1) of STRATEGY against BASELINE."""
-    win_rate_as_player_0 = 1 - make_averaged(winner)(strategy, baseline)
-    win_rate_as_player_1 = make_averaged(winner)(baseline, strategy)
+def can_pickle(*strategies):
+    """Return whether all STRATEGIES can be pickled, and so sent to worker
+    processes. Nested functions and lambdas can't be."""
+    try:
+        pickle.dumps(strategies)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+def count_wins(strategy0, strategy1, num_games):
+    """Return how many of NUM_GAMES games of STRATEGY0 against STRATEGY1 are
+    won by strategy1.
+
+    Games of final_strategy against always_roll are simulated in one batch by
+    the specialized simulate_final_strategy rather than by play, as long as
+    six_sided and four_sided are the fair dice that it assumes and always_roll
+    rolls a legal number of dice. Otherwise play's checks apply as usual:
+
+    >>> count_wins(final_strategy, always_roll(11), 10)
+    Traceback (most recent call last):
+        ...
+    AssertionError: Cannot roll more than 10 dice.
+    """
+    fair_dice = getattr(six_sided, 'sides', None) == 6 and getattr(four_sided, 'sides', None) == 4
+    for final_player, baseline in ((0, strategy1), (1, strategy0)):
+        final = strategy1 if final_player else strategy0
+        num_rolls = fixed_num_rolls(baseline)
+        if fair_dice and final is final_strategy and num_rolls is not None:
+            return simulate_final_strategy(num_rolls, final_player, num_games)
+    return sum(winner(strategy0, strategy1) for _ in range(num_games))
+
+def fixed_num_rolls(strategy):
+    """Return N if STRATEGY is always_roll(N) for a legal number of dice N, and
+    None otherwise.
+
+    >>> fixed_num_rolls(always_roll(5))
+    5
+    >>> fixed_num_rolls(always_roll(11)) is None
+    True
+    >>> fixed_num_rolls(bacon_strategy) is None
+    True
+    """
+    if not (isinstance(strategy, partial) and strategy.func is roll_n
+            and len(strategy.args) == 1 and not strategy.keywords):
+        return None
+    num_rolls = strategy.args[0]
+    if type(num_rolls) == int and 0 <= num_rolls <= MAX_DICE_ROLLS:
+        return num_rolls
+    return None
+
+def average_win_rate(strategy, baseline=always_roll(BASELINE_NUM_ROLLS),
+                     num_samples=1000, num_workers=1):
+    """Return the average win rate (0 to 1) of STRATEGY against BASELINE.
+
+    Games are independent, so with NUM_WORKERS above 1 they are split across
+    that many worker processes, as long as both strategies can be pickled.
+    Starting the workers costs more than a thousand games, so this only pays
+    off for large NUM_SAMPLES. Under the spawn start method, the caller must
+    be guarded by if __name__ == '__main__'.
+    """
+    assert num_workers >= 1, 'Must use at least one worker.'
+    if num_workers > 1 and not can_pickle(strategy, baseline):
+        num_workers = 1
+    if num_workers > 1 and final_strategy in (strategy, baseline):
+        # Solve once here rather than in every forked worker
+        load_final_strategy()
+
+    # Split the games in each seating as evenly as possible between the workers
+    num_games = [num_samples // num_workers + (i < num_samples % num_workers)
+                 for i in range(num_workers)]
+    tasks = [(strategy, baseline, n) for n in num_games] + \
+            [(baseline, strategy, n) for n in num_games]
+    if num_workers == 1:
+        wins = [count_wins(*task) for task in tasks]
+    else:
+        # Reseed each worker, which would otherwise inherit the same random state
+        with Pool(num_workers, initializer=seed) as pool:
+            wins = pool.starmap(count_wins, tasks)
+    win_rate_as_player_0 = 1 - sum(wins[:num_workers]) / num_samples
+    win_rate_as_player_1 = sum(wins[num_workers:]) / num_samples
     return (win_rate_as_player_0 + win_rate_as_player_1) / 2 # Average results
 
-def run_experiments():
-    """Run a series of strategy experiments and report results."""
+def run_experiments(num_workers=1):
+    """Run a series of strategy experiments and report results.
+
+    With NUM_WORKERS above 1, the win rate experiments run in that many worker
+    processes, or a single experiment splits its games between them. Under the
+    spawn start method, the caller must be guarded by if __name__ == '__main__'.
+    """
+    assert num_workers >= 1, 'Must use at least one worker.'
     if False: # Changed to False when done finding max_scoring_num_rolls
         six_sided_max = max_scoring_num_rolls(six_sided)
         print('Max scoring num rolls for six-sided dice:', six_sided_max)
         four_sided_max = max_scoring_num_rolls(four_sided)
         print('Max scoring num rolls for four-sided dice:', four_sided_max)
 
+    # Strategies whose win rates to report, as (name, strategy) pairs
+    experiments = []
+
     if False: # Change to True to test always_roll(8)
-        print('always_roll(8) win rate:', average_win_rate(always_roll(8)))
+        experiments.append(('always_roll(8)', always_roll(8)))
 
     if False: # Change to True to test bacon_strategy
-        print('bacon_strategy win rate:', average_win_rate(bacon_strategy))
+        experiments.append(('bacon_strategy', bacon_strategy))
 
     if False: # Change to True to test swap_strategy
-        print('swap_strategy win rate:', average_win_rate(swap_strategy))
+        experiments.append(('swap_strategy', swap_strategy))
 
     if True: # Change to True to test final_strategy
-        print('final_strategy win rate:', average_win_rate(final_strategy))
+        experiments.append(('final_strategy', final_strategy))
 
     "*** You may add additional experiments as you wish ***"
 
+    strategies = [strategy for _, strategy in experiments]
+    if num_workers == 1 or len(experiments) < 2 or not can_pickle(*strategies):
+        # A single experiment can still split its games between the workers
+        for name, strategy in experiments:
+            print(name + ' win rate:', average_win_rate(strategy, num_workers=num_workers))
+        return
+
+    # Experiments are independent, so evaluate each of them in its own process,
+    # reseeded so that they don't all inherit the same random state
+    with ProcessPoolExecutor(num_workers, initializer=seed) as executor:
+        win_rates = [executor.submit(average_win_rate, strategy) for strategy in strategies]
+        for (name, _), win_rate in zip(experiments, win_rates):
+            print(name + ' win rate:', win_rate.result())
+
 # Strategies
 
 def bacon_strategy(score, opponent_score):
@@ -257,7 +378,7 @@ def bacon_strategy(score, opponent_score):
     0
     """
     # If free bacon rule would give at least BACAON_MARGIN POINTS
-    if max(opponent_score % 10, opponent_score // 10) + 1 >= BACON_MARGIN:
+    if FREE_BACON[opponent_score] >= BACON_MARGIN:
         return 0
     else:
         return BASELINE_NUM_ROLLS
@@ -278,7 +399,7 @@ def swap_strategy(score, opponent_score):
     >>> swap_strategy(12, 12) # Baseline
     5
     """
-    free_bacon_score = score + max(opponent_score % 10, opponent_score // 10) + 1
+    free_bacon_score = score + FREE_BACON[opponent_score]
 
     if free_bacon_score * 2 == opponent_score:
         return 0
@@ -293,32 +414,30 @@ def swap_strategy(score, opponent_score):
 # Algorithm inspired by the following blog post:
 # Source: https://old.paulbramsen.com/archives/32
 def final_strategy(score, opponent_score):
-    """This strategy uses a recursive approach to calculate the optimal number of dice to roll based on:
+    """This strategy looks up the optimal number of dice to roll, which is precomputed based on:
     - The current score and opponent_score
     - Probability of winning for each possible number of dice to roll
 
-    The optimal number of dice is determined by comparing the probability of winning for each potential option, and choosing the highest 
-    """
-    return best_num_dice_to_roll(score, opponent_score)
-
-def memoized(func) -> Callable[..., Union[int, float]]:
-    """Decorator that caches previously seen results and returns the memoized ver of func
+    The optimal number of dice is determined by comparing the probability of winning for each potential option, and choosing the highest.
+    See solve_final_strategy for how the table is computed, and best_num_dice_to_roll for the equivalent recursive definition.
+    The table is only computed the first time this strategy is used, so that importing hog stays fast.
 
-    @param: func: a function that computes some result
-    @return: func: memoized version of func    
+    >>> # Includes hog wild totals (multiples of 7) and states next to a swine swap
+    >>> states = [(0, 0), (35, 28), (30, 40), (24, 48), (48, 24), (10, 30), (50, 50), (90, 95), (97, 3)]
+    >>> [final_strategy(score, opponent_score) == best_num_dice_to_roll(score, opponent_score)
+    ...  for score, opponent_score in states]
+    [True, True, True, True, True, True, True, True, True]
     """
-    cache = {}
-
-    def wrapper(*args):
-        # if already seen, return the result
-        if args in cache:
-            return cache[args]
-        # stores the result of func(args) in the cache and returns the value
-        result = func(*args)
-        cache[args] = result
-        return result
+    # The table is flat, so an out of range score would silently read another state's answer
+    assert 0 <= score < GOAL_SCORE, 'score must be between 0 and the goal.'
+    assert 0 <= opponent_score < GOAL_SCORE, 'opponent_score must be between 0 and the goal.'
+    if BEST_NUM_ROLLS is None:
+        load_final_strategy()
+    return BEST_NUM_ROLLS[score * GOAL_SCORE + opponent_score]
 
-    return wrapper
+# Decorator that caches previously seen results and returns the memoized ver of func.
+# lru_cache is implemented in C, so cache hits don't pay for an extra Python call.
+memoized = lru_cache(maxsize=None)
 
 @memoized
 def best_num_dice_to_roll(score, opponent_score) -> int:
@@ -329,13 +448,10 @@ def best_num_dice_to_roll(score, opponent_score) -> int:
 
     @return: best number of dice to roll
     """
-    # Sets recursion limit to MAX_RECURSION_DEPTH
-    if sys.getrecursionlimit() < MAX_RECURSION_DEPTH:
-        sys.setrecursionlimit(MAX_RECURSION_DEPTH)
+    # Start from rolling 0 dice, so that it stays a candidate even when no option can win
+    best_probability, best_num_of_dice = probability_of_winning_by_rolling_n(score, opponent_score, 0), 0
 
-    best_probability, best_num_of_dice = 0, 1
-
-    num_of_dice = 0
+    num_of_dice = 1
     while num_of_dice <= MAX_DICE_ROLLS:
         # Iterate through number of possible dice rolls, finding best probability of winning
         curr_probability = probability_of_winning_by_rolling_n(score, opponent_score, num_of_dice)
@@ -357,7 +473,7 @@ def probability_of_winning_by_rolling_n(score, opponent_score, n) -> float:
 
     @return: the probability of winning 
     """
-    free_bacon_score = max(opponent_score % 10, opponent_score // 10) + 1
+    free_bacon_score = FREE_BACON[opponent_score]
     sides = 6
     # Hog wild 
     if (score + opponent_score) % 7 == 0:
@@ -369,11 +485,11 @@ def probability_of_winning_by_rolling_n(score, opponent_score, n) -> float:
         turn_score = free_bacon_score
         win_probability = probability_of_winning_with_turn_end_scores(score + turn_score, opponent_score)
     else:
-        # Iterate over all possible scores to calculate the probability of winning
-        possible_score = 1
-        while possible_score <= sides * n:
-            win_probability += (probability_of_scoring(possible_score, n, sides)) * probability_of_winning_with_turn_end_scores(score + possible_score, opponent_score)
-            possible_score += 1
+        # Weigh the probability of winning after each possible turn score by its probability
+        distribution = turn_score_distribution(n, sides)
+        win_probabilities = [probability_of_winning_with_turn_end_scores(score + possible_score, opponent_score)
+                             for possible_score in range(1, sides * n + 1)]
+        win_probability = sum(map(mul, distribution[1:], win_probabilities))
 
     return win_probability
 
@@ -402,7 +518,29 @@ def probability_of_winning_with_turn_end_scores(score, opponent_score) -> float:
 
 # The following functions are derived from Professor John DeNero's fa13 Lecture 8 Video 5 on winning Hog
 # Source: https://youtu.be/xqRosBPbUXI?si=F5O5MSTI_nyr3sfK  
-@memoized    
+@memoized
+def ways_to_score_table(s, max_n=MAX_DICE_ROLLS) -> tuple:
+    """Tabulates the number of ways to score with up to max_n s-sided
+    dice without incurring the Pig Out Rule, filling the table one die at a time
+
+    @param s: int: the sides of dice 4 or 6
+    @param max_n: int: the largest number of dice rolls in the table
+
+    @return: table where table[n][k] is the number of ways to score k with n s-sided dice
+    """
+    table = [(1,) + (0,) * (s * max_n)]
+    for n in range(1, max_n + 1):
+        previous, current = table[n - 1], [0] * (s * max_n + 1)
+        # Every die that doesn't pig out adds between 2 and s points
+        for k in range(2 * n, s * n + 1):
+            ways = 0
+            for dice in range(2, min(s, k) + 1):
+                ways += previous[k - dice]
+            current[k] = ways
+        table.append(tuple(current))
+
+    return tuple(table)
+
 def number_of_ways_to_score(k, n, s) -> int:
     """Calculates the number of ways that k can be scored by rolling n
     s-sided dice without incurring the Pig Out Rule
@@ -413,20 +551,31 @@ def number_of_ways_to_score(k, n, s) -> int:
 
     @return: number of ways to score k with n s-sided dice
 
+    >>> number_of_ways_to_score(20, 11, 6)
+    0
+    >>> number_of_ways_to_score(25, 11, 6)
+    286
     """
-    if n == 0:
-        if k == 0:
-            return 1
+    if k < 0 or k > s * n:
         return 0
+    # The shared table covers every legal number of dice; only build a bigger one if asked for more
+    return ways_to_score_table(s, max(n, MAX_DICE_ROLLS))[n][k]
 
-    ways, dice = 0, 2
-    while dice <= s:
-        ways += number_of_ways_to_score(k - dice, n - 1, s)
-        dice += 1
+# Powers of the number of sides (and sides - 1) of each dice, up to MAX_DICE_ROLLS
+POW = {s: tuple(s ** i for i in range(MAX_DICE_ROLLS + 1)) for s in (3, 4, 5, 6)}
 
-    return ways
+def power(s, n) -> int:
+    """Returns s ** n, looking it up in POW when it's there
+
+    @param s: int: the base, such as the sides of dice
+    @param n: int: the number of dice rolls
+
+    @return: s ** n
+    """
+    if s in POW and 0 <= n <= MAX_DICE_ROLLS:
+        return POW[s][n]
+    return s ** n
 
-@memoized
 def probability_of_scoring(k, n, s) -> float:
     """Calculates probability of scoring k points with n s-sided dice
     
@@ -436,10 +585,159 @@ def probability_of_scoring(k, n, s) -> float:
 
     @return: probability of scoring k points with n s-sided dice
 
+    >>> probability_of_scoring(25, 11, 6) == 286 / 6 ** 11
+    True
+    >>> probability_of_scoring(2, 1, 2)
+    0.5
+    >>> probability_of_scoring(1, 2, 3)
+    0.5555555555555556
     """
     if k == 1:
-        return 1 - pow(s - 1, n) / pow(s, n)
-    return number_of_ways_to_score(k, n, s) / pow(s, n)
+        return 1 - power(s - 1, n) / power(s, n)
+    return number_of_ways_to_score(k, n, s) / power(s, n)
+
+@memoized
+def turn_score_distribution(n, s) -> tuple:
+    """Computes the probability distribution of the turn score from rolling n s-sided dice
+
+    @param n: int: the number of dice rolls 1 <= n <= 10
+    @param s: int: the sides of dice 4 or 6
+
+    @return: tuple where index k holds the probability of scoring k points, for 0 <= k <= s * n
+
+    """
+    return (0,) + tuple(probability_of_scoring(k, n, s) for k in range(1, s * n + 1))
+
+def solve_final_strategy() -> bytes:
+    """Computes the best number of dice to roll for every pair of scores bottom-up,
+    instead of recursing through best_num_dice_to_roll
+
+    A turn always scores at least 1 point, so a state only depends on states whose scores add up to a larger
+    total. Sweeping the totals from highest to lowest therefore fills in every state after the ones it needs.
+
+    @return: table where table[score * GOAL_SCORE + opponent_score] is the number of dice to roll that
+             maximizes the probability of winning, packed one byte per state
+    """
+    best = bytearray(GOAL_SCORE * GOAL_SCORE)
+
+    # turn_end[opponent_score][score] caches probability_of_winning_with_turn_end_scores for every score a
+    # turn can end with. Rows are per opponent score, so that a state reads all of its outcomes as one
+    # contiguous slice of a row.
+    max_turn_end_score = GOAL_SCORE - 1 + 6 * MAX_DICE_ROLLS
+    turn_end = []
+    for opponent_score in range(GOAL_SCORE):
+        # Reaching the goal wins, unless swine swap hands that score to the opponent
+        turn_end.append([0.0] * GOAL_SCORE + [0.0 if opponent_score * 2 == score else 1.0
+                                              for score in range(GOAL_SCORE, max_turn_end_score + 1)])
+
+    # The distributions only depend on the dice, so look them up once rather than in every state
+    distributions = {sides: [turn_score_distribution(n, sides) for n in range(1, MAX_DICE_ROLLS + 1)]
+                     for sides in (4, 6)}
+    num_of_dice_options = range(MAX_DICE_ROLLS + 1)
+
+    # States with the same total don't depend on each other, so each diagonal can be filled in any order
+    for total in range(2 * GOAL_SCORE - 2, -1, -1):
+        # Hog wild
+        sides = 4 if total % 7 == 0 else 6
+        sides_distributions = distributions[sides]
+        max_turn_score = sides * MAX_DICE_ROLLS
+
+        for score in range(max(0, total - GOAL_SCORE + 1), min(total, GOAL_SCORE - 1) + 1):
+            opponent_score = total - score
+
+            # Probability of winning after scoring each possible number of points this turn, where index 0
+            # isn't a possible outcome and only lines the slice up with the turn score distributions
+            turn_end_win_probabilities = turn_end[opponent_score][score:score + max_turn_score + 1]
+            probabilities = [turn_end_win_probabilities[FREE_BACON[opponent_score]]]
+            for distribution in sides_distributions:
+                probabilities.append(sum(map(mul, distribution, turn_end_win_probabilities)))
+
+            best_num_of_dice = max(num_of_dice_options, key=probabilities.__getitem__)
+            best[score * GOAL_SCORE + opponent_score] = best_num_of_dice
+            win_probability = probabilities[best_num_of_dice]
+
+            # Ending a turn with the opponent at score and me at opponent_score hands them this state,
+            # unless swine swap switches the scores back
+            if score * 2 == opponent_score or opponent_score * 2 == score:
+                turn_end[opponent_score][score] = 1 - win_probability
+            else:
+                turn_end[score][opponent_score] = 1 - win_probability
+
+    return bytes(best)
+
+# Filled in by load_final_strategy the first time it's needed
+BEST_NUM_ROLLS = None
+
+def load_final_strategy() -> bytes:
+    """Solves the final strategy into BEST_NUM_ROLLS, unless that's already been done
+
+    Solving twice gives the same table, so a second caller racing the first only wastes time.
+
+    @return: BEST_NUM_ROLLS
+    """
+    global BEST_NUM_ROLLS
+    if BEST_NUM_ROLLS is None:
+        BEST_NUM_ROLLS = solve_final_strategy()
+    return BEST_NUM_ROLLS
+
+def simulate_final_strategy(num_rolls, final_player, num_games):
+    """Simulate NUM_GAMES games of final_strategy against always_roll(NUM_ROLLS)
+    with fair dice, and return how many of them are won by Player 1.
+
+    This is play specialized to these two strategies and batched over many
+    games: final_strategy becomes a lookup in BEST_NUM_ROLLS, and each die is
+    drawn inline from random() instead of through take_turn and roll_dice.
+    A turn stops rolling at the first 1, since the rest can't change its score.
+
+    final_player:  The player that uses final_strategy, 0 (first) or 1 (second).
+
+    Its win counts agree with play's, which count_wins falls back to for a
+    strategy it doesn't recognize, to within sampling noise in either seating:
+
+    >>> seed(0)
+    >>> final_via_play = lambda score, opponent_score: final_strategy(score, opponent_score)
+    >>> [abs(count_wins(final_strategy, always_roll(n), 2000) - count_wins(final_via_play, always_roll(n), 2000)) < 80
+    ...  for n in (0, 5, 10)]
+    [True, True, True]
+    >>> [abs(count_wins(always_roll(n), final_strategy, 2000) - count_wins(always_roll(n), final_via_play, 2000)) < 80
+    ...  for n in (0, 5, 10)]
+    [True, True, True]
+    """
+    best, free_bacon, rand = load_final_strategy(), FREE_BACON, random
+    player_1_wins = 0
+    for _ in range(num_games):
+        who = 0  # Which player is about to take a turn, 0 (first) or 1 (second)
+        score, opponent_score = 0, 0  # Scores of the player about to move and of the other player
+        while score < GOAL_SCORE and opponent_score < GOAL_SCORE:
+            n = best[score * GOAL_SCORE + opponent_score] if who == final_player else num_rolls
+            if n == 0:
+                # Free bacon
+                score += free_bacon[opponent_score]
+            else:
+                # Hog wild
+                sides = 4 if (score + opponent_score) % 7 == 0 else 6
+                turn_score = 0
+                for _ in range(n):
+                    outcome = int(rand() * sides) + 1
+                    if outcome == 1:
+                        # Pig out
+                        turn_score = 1
+                        break
+                    turn_score += outcome
+                score += turn_score
+            # Swine swap
+            if score * 2 == opponent_score or opponent_score * 2 == score:
+                score, opponent_score = opponent_score, score
+            # Switch to the other player, who is now the one about to move
+            score, opponent_score = opponent_score, score
+            who = 1 - who
+
+        # Player 0 only wins with a strictly higher score, as in winner
+        score0, score1 = (score, opponent_score) if who == 0 else (opponent_score, score)
+        if score0 <= score1:
+            player_1_wins += 1
+
+    return player_1_wins
 
 ##########################
 # Command Line Interface #
@@ -503,7 +801,11 @@ def run(*args):
                         help='Run interactive tests for the specified question')
     parser.add_argument('--run_experiments', '-r', action='store_true',
                         help='Runs strategy experiments')
+    parser.add_argument('--num_workers', '-w', type=int, default=1,
+                        help='Number of processes to run experiments in')
     args = parser.parse_args()
+    if args.num_workers < 1:
+        parser.error('--num_workers must be at least 1')
 
     if args.interactive:
         test = args.interactive + '_interactive'
@@ -517,4 +819,4 @@ def run(*args):
             print('\nQuitting interactive test')
             exit(0)
     elif args.run_experiments:
-        run_experiments()
+        run_experiments(args.num_workers)